@@ -0,0 +1,58 @@
+"""Microbenchmark for the chunking stage of ingestion.
+
+Builds synthetic pages and times `process_chunks` end to end, reporting
+chunks/second. Run from the GA02 directory:
+
+    python benchmark_ingest.py --chunks 1000000
+"""
+import argparse
+import time
+from langchain_core.documents import Document as LC_Document
+from config import Config
+from ingest import process_chunks
+
+WORDS = "retrieval augmented generation grounds answers in indexed documents".split()
+
+def make_page(n_chars: int) -> str:
+    """Synthetic page text with the whitespace and non-ASCII noise real PDFs produce."""
+    parts = []
+    size = 0
+    i = 0
+    while size < n_chars:
+        word = WORDS[i % len(WORDS)]
+        sep = "\n\n" if i % 97 == 0 else ("  \t" if i % 13 == 0 else " ")
+        if i % 31 == 0:
+            word += "—"
+        parts.append(word + sep)
+        size += len(word) + len(sep)
+        i += 1
+    return "".join(parts)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunks", type=int, default=1_000_000, help="approximate number of chunks to produce")
+    parser.add_argument("--chunks-per-page", type=int, default=10)
+    args = parser.parse_args()
+
+    step = Config.CHUNK_SIZE - Config.CHUNK_OVERLAP
+    page = make_page(step * args.chunks_per_page)
+    n_pages = max(1, args.chunks // args.chunks_per_page)
+    docs = [
+        LC_Document(
+            page_content=page,
+            metadata={"source_id": f"doc_{i // 50}.pdf", "source_type": "pdf", "title": f"doc_{i // 50}.pdf", "page": i % 50}
+        )
+        for i in range(n_pages)
+    ]
+
+    start = time.perf_counter()
+    batch = process_chunks(docs)
+    elapsed = time.perf_counter() - start
+
+    print(f"pages:    {n_pages}")
+    print(f"chunks:   {len(batch)}")
+    print(f"elapsed:  {elapsed:.2f}s")
+    print(f"rate:     {len(batch) / elapsed:,.0f} chunks/s")
+
+if __name__ == "__main__":
+    main()
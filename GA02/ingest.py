@@ -1,71 +1,157 @@
-import re
-import uuid
-from typing import List
-from langchain_community.document_loaders import PyPDFLoader, TextLoader, WikipediaLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+import codecs
+import hashlib
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+from pypdf import PdfReader
 from langchain_core.documents import Document as LC_Document
-from models import DocumentChunk, SourceType
+from config import Config
+from models import ChunkBatch, SourceType
+
+# Codec error handler that swaps each run of non-ASCII characters for one space;
+# encoding with it is several times faster than re.sub(r'[^\x00-\x7F]+', ' ', ...)
+codecs.register_error("ingest.non_ascii_to_space", lambda err: (" ", err.end))
 
 def clean_text(text: str) -> str:
     """Removes noise, excessive whitespace, and non-printable characters."""
-    text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-    text = re.sub(r'[^\x00-\x7F]+', ' ', text)  # Remove non-ASCII
-    return text.strip()
-
-def load_documents(files) -> List[LC_Document]:
-    """Loads documents from uploaded Streamlit files or paths."""
-    raw_docs = []
-    
+    if not text.isascii():
+        text = text.encode("ascii", "ingest.non_ascii_to_space").decode("ascii")  # Remove non-ASCII
+    return ' '.join(text.split())  # Normalize whitespace
+
+def split_text(text: str, chunk_size: int = Config.CHUNK_SIZE, chunk_overlap: int = Config.CHUNK_OVERLAP) -> List[str]:
+    """Splits already-cleaned text into overlapping windows on space boundaries.
+
+    Input is expected to come from `clean_text` (single spaces, no newlines), so
+    a boundary scan with str.rfind/str.find replaces the recursive splitter.
+    Words longer than `chunk_size` are hard-cut.
+    """
+    chunks = []
+    n = len(text)
+    start = 0
+    while start < n:
+        end = start + chunk_size
+        if end >= n:
+            chunks.append(text[start:])
+            break
+        cut = text.rfind(' ', start, end + 1)
+        if cut <= start:
+            # No space in the window: hard-cut the word, still keeping the overlap
+            chunks.append(text[start:end])
+            start = max(end - chunk_overlap, start + 1)
+            continue
+        chunks.append(text[start:cut])
+        # Restart at the first word boundary inside the overlap window
+        overlap = text.find(' ', max(cut - chunk_overlap, start + 1), cut)
+        start = overlap + 1 if overlap != -1 else cut
+        if start < n and text[start] == ' ':
+            start += 1
+    return chunks
+
+def chunk_id_for(source_id: str, content_hash: Optional[str], page_number: Optional[int], index: int, content: str) -> str:
+    """Deterministic chunk ID derived from the chunk's source file (name and bytes), page, position and text."""
+    key = f"{source_id}\x1f{content_hash}\x1f{page_number}\x1f{index}\x1f{content}".encode("utf-8", "replace")
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+def file_hash(data) -> str:
+    """Returns a SHA-256 digest of the raw file bytes (accepts bytes or memoryview)."""
+    return hashlib.sha256(data).hexdigest()
+
+def _tag_metadata(docs: List[LC_Document], file_name: str, source_type: SourceType, digest: str):
+    for d in docs:
+        d.metadata["source_id"] = file_name
+        d.metadata["source_type"] = source_type.value
+        d.metadata["title"] = file_name
+        d.metadata["content_hash"] = digest
+
+def _load_pdf(file, file_name: str) -> List[LC_Document]:
+    """Parses a PDF straight from its in-memory stream, one Document per page."""
+    file.seek(0)
+    reader = PdfReader(file)
+    return [
+        LC_Document(
+            page_content=page.extract_text() or "",
+            metadata={"source": file_name, "page": i}
+        )
+        for i, page in enumerate(reader.pages)
+    ]
+
+def _load_text(buffer, file_name: str) -> List[LC_Document]:
+    """Decodes a text/markdown upload directly from its buffer."""
+    return [LC_Document(
+        page_content=str(buffer, "utf-8", "replace"),
+        metadata={"source": file_name}
+    )]
+
+@dataclass
+class LoadResult:
+    """Outcome of `load_documents`: the parsed pages plus per-file bookkeeping."""
+    documents: List[LC_Document] = field(default_factory=list)
+    new_hashes: Set[str] = field(default_factory=set)
+    skipped: List[str] = field(default_factory=list)  # Already ingested (same bytes)
+    failed: List[str] = field(default_factory=list)  # Could not be parsed
+
+def load_documents(files, seen_hashes: Optional[Set[str]] = None) -> LoadResult:
+    """Loads documents from uploaded Streamlit files without touching disk.
+
+    Uploads are read through their in-memory buffers. Files whose bytes hash
+    to a digest in `seen_hashes` (or earlier in the same batch) are skipped,
+    whatever their name. `seen_hashes` is not modified: callers should add
+    `new_hashes` only once the documents are actually indexed. A file that
+    fails to parse is recorded in `failed` and does not abort the batch.
+    """
+    result = LoadResult()
+    if seen_hashes is None:
+        seen_hashes = set()
+
     for file in files:
-        # Handle Streamlit UploadedFile specifically in main app, 
-        # here we assume file paths or temp file handling
         file_name = file.name
-        temp_path = f"temp_{file_name}"
-        
-        with open(temp_path, "wb") as f:
-            f.write(file.getvalue())
-
-        try:
-            if file_name.endswith(".pdf"):
-                loader = PyPDFLoader(temp_path)
-                docs = loader.load()
-                # Tag metadata
-                for d in docs:
-                    d.metadata["source_id"] = file_name
-                    d.metadata["source_type"] = SourceType.PDF.value
-                    d.metadata["title"] = file_name
-                raw_docs.extend(docs)
-            elif file_name.endswith(".txt") or file_name.endswith(".md"):
-                loader = TextLoader(temp_path)
-                docs = loader.load()
-                for d in docs:
-                    d.metadata["source_id"] = file_name
-                    d.metadata["source_type"] = SourceType.TEXT.value
-                    d.metadata["title"] = file_name
-                raw_docs.extend(docs)
-        finally:
-            # Cleanup would happen here in a real OS-level script
-            pass
-            
-    return raw_docs
-
-def process_chunks(raw_docs: List[LC_Document]) -> List[DocumentChunk]:
-    splitter = RecursiveCharacterTextSplitter(
-        chunk_size=1000, 
-        chunk_overlap=200,
-        separators=["\n\n", "\n", " ", ""]
-    )
-    
-    lc_chunks = splitter.split_documents(raw_docs)
-    
-    processed_chunks = []
-    for chunk in lc_chunks:
-        processed_chunks.append(DocumentChunk(
-            chunk_id=str(uuid.uuid4()),
-            source_id=chunk.metadata.get("source_id", "unknown"),
-            source_type=chunk.metadata.get("source_type", SourceType.TEXT),
-            title=chunk.metadata.get("title", "Untitled"),
-            content=clean_text(chunk.page_content),
-            page_number=chunk.metadata.get("page", None)
-        ))
-    return processed_chunks
\ No newline at end of file
+        # getbuffer() exposes the upload's bytes without copying them
+        with file.getbuffer() as buffer:
+            digest = file_hash(buffer)
+            if digest in seen_hashes or digest in result.new_hashes:
+                result.skipped.append(file_name)
+                continue
+
+            try:
+                if file_name.endswith(".pdf"):
+                    docs = _load_pdf(file, file_name)
+                    source_type = SourceType.PDF
+                elif file_name.endswith(".txt") or file_name.endswith(".md"):
+                    docs = _load_text(buffer, file_name)
+                    source_type = SourceType.TEXT
+                else:
+                    continue
+            except Exception as e:
+                print(f"Failed to load {file_name}: {e}")
+                result.failed.append(file_name)
+                continue
+
+        _tag_metadata(docs, file_name, source_type, digest)
+        result.documents.extend(docs)
+        result.new_hashes.add(digest)
+
+    return result
+
+def process_chunks(raw_docs: List[LC_Document]) -> ChunkBatch:
+    """Cleans each page once, splits it, and appends the chunks to a ChunkBatch."""
+    batch = ChunkBatch()
+
+    for doc in raw_docs:
+        metadata = doc.metadata
+        source_id = metadata.get("source_id", "unknown")
+        source_type = metadata.get("source_type", SourceType.TEXT.value)
+        title = metadata.get("title", "Untitled")
+        page_number = metadata.get("page", None)
+        content_hash = metadata.get("content_hash", None)
+
+        texts = split_text(clean_text(doc.page_content))
+        n = len(texts)
+
+        batch.chunk_ids.extend(chunk_id_for(source_id, content_hash, page_number, i, t) for i, t in enumerate(texts))
+        batch.source_ids.extend([source_id] * n)
+        batch.source_types.extend([source_type] * n)
+        batch.titles.extend([title] * n)
+        batch.contents.extend(texts)
+        batch.page_numbers.extend([page_number] * n)
+        batch.content_hashes.extend([content_hash] * n)
+
+    return batch
@@ -20,6 +20,9 @@ if "rag_engine" not in st.session_state:
 if "messages" not in st.session_state:
     st.session_state.messages = []
 
+if "ingested_hashes" not in st.session_state:
+    st.session_state.ingested_hashes = st.session_state.rag_engine.vector_db.indexed_hashes()
+
 # --- SIDEBAR: Document Management ---
 with st.sidebar:
     st.header("📂 Knowledge Base")
@@ -32,10 +35,19 @@ with st.sidebar:
     if st.button("Ingest Documents"):
         if uploaded_files:
             with st.spinner("Processing documents..."):
-                raw_docs = load_documents(uploaded_files)
-                chunks = process_chunks(raw_docs)
-                st.session_state.rag_engine.vector_db.create_index(chunks)
-                st.success(f"Indexed {len(chunks)} chunks!")
+                result = load_documents(uploaded_files, st.session_state.ingested_hashes)
+                if result.documents:
+                    chunks = process_chunks(result.documents)
+                    st.session_state.rag_engine.vector_db.create_index(chunks)
+                    # Only remember files once their chunks are safely indexed
+                    st.session_state.ingested_hashes.update(result.new_hashes)
+                    st.success(f"Indexed {len(chunks)} chunks!")
+                    if result.skipped:
+                        st.info(f"Skipped {len(result.skipped)} file(s) already ingested: {', '.join(result.skipped)}")
+                elif result.skipped and not result.failed:
+                    st.info("These documents are already indexed.")
+                if result.failed:
+                    st.warning(f"Could not read {len(result.failed)} file(s): {', '.join(result.failed)}")
         else:
             st.warning("Please upload files first.")
 
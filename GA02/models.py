@@ -1,6 +1,7 @@
+from dataclasses import dataclass, field
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 class SourceType(str, Enum):
     PDF = "pdf"
@@ -16,6 +17,7 @@ class DocumentChunk(BaseModel):
     content: str
     page_number: Optional[int] = None
     url: Optional[str] = None
+    content_hash: Optional[str] = None
     
     @property
     def citation_label(self):
@@ -24,6 +26,54 @@ class DocumentChunk(BaseModel):
             return f"[Web] {self.title}"
         return f"[Doc] {self.title}" + (f" (Pg {self.page_number})" if self.page_number else "")
 
+@dataclass(slots=True)
+class ChunkBatch:
+    """Column-oriented batch of chunks produced by ingestion.
+
+    Holds one list per field instead of one pydantic object per chunk, so large
+    ingests avoid per-chunk validation. Iterate to materialise DocumentChunks.
+    """
+    chunk_ids: List[str] = field(default_factory=list)
+    source_ids: List[str] = field(default_factory=list)
+    source_types: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    contents: List[str] = field(default_factory=list)
+    page_numbers: List[Optional[int]] = field(default_factory=list)
+    content_hashes: List[Optional[str]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    def __iter__(self) -> Iterator[DocumentChunk]:
+        for i in range(len(self)):
+            yield DocumentChunk(
+                chunk_id=self.chunk_ids[i],
+                source_id=self.source_ids[i],
+                source_type=self.source_types[i],
+                title=self.titles[i],
+                content=self.contents[i],
+                page_number=self.page_numbers[i],
+                content_hash=self.content_hashes[i]
+            )
+
+    def metadatas(self) -> List[dict]:
+        """Per-chunk metadata dicts (everything except content) for the vector store."""
+        return [
+            {
+                "chunk_id": chunk_id,
+                "source_id": source_id,
+                "source_type": source_type,
+                "title": title,
+                "page_number": page_number,
+                "url": None,
+                "content_hash": content_hash
+            }
+            for chunk_id, source_id, source_type, title, page_number, content_hash in zip(
+                self.chunk_ids, self.source_ids, self.source_types,
+                self.titles, self.page_numbers, self.content_hashes
+            )
+        ]
+
 class SearchResult(BaseModel):
     query: str
     chunks: List[DocumentChunk]
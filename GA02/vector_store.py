@@ -3,7 +3,7 @@ from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_core.documents import Document as LC_Document
 from config import Config
-from models import DocumentChunk
+from models import ChunkBatch, DocumentChunk
 
 class VectorDB:
     def __init__(self):
@@ -11,18 +11,22 @@ class VectorDB:
         self.db = None
         self.load_index()
 
-    def create_index(self, chunks: list[DocumentChunk]):
+    def create_index(self, chunks: ChunkBatch):
         lc_docs = [
             LC_Document(
-                page_content=c.content,
-                metadata=c.model_dump(exclude={"content"}) # Store all metadata except content duplication
-            ) for c in chunks
+                page_content=content,
+                metadata=metadata # Store all metadata except content duplication
+            ) for content, metadata in zip(chunks.contents, chunks.metadatas())
         ]
         
         if not lc_docs:
             return
 
-        self.db = FAISS.from_documents(lc_docs, self.embeddings)
+        # Extend the existing index so earlier (deduplicated) uploads stay searchable
+        if self.db:
+            self.db.add_documents(lc_docs)
+        else:
+            self.db = FAISS.from_documents(lc_docs, self.embeddings)
         self.db.save_local(Config.VECTOR_DB_PATH)
         print(f"Indexed {len(chunks)} chunks.")
 
@@ -34,6 +38,18 @@ class VectorDB:
                 allow_dangerous_deserialization=True
             )
 
+    def indexed_hashes(self) -> set[str]:
+        """Content hashes of every source file already stored in the index."""
+        if not self.db:
+            return set()
+        hashes = set()
+        for doc_id in self.db.index_to_docstore_id.values():
+            doc = self.db.docstore.search(doc_id)
+            # search() returns an error string rather than raising for unknown ids
+            if isinstance(doc, LC_Document) and doc.metadata.get("content_hash"):
+                hashes.add(doc.metadata["content_hash"])
+        return hashes
+
     def search(self, query: str, k: int = 4) -> list[DocumentChunk]:
         if not self.db:
             return []
@@ -48,6 +64,7 @@ class VectorDB:
                 title=doc.metadata.get("title"),
                 content=doc.page_content,
                 page_number=doc.metadata.get("page_number"),
-                url=doc.metadata.get("url")
+                url=doc.metadata.get("url"),
+                content_hash=doc.metadata.get("content_hash")
             ))
         return chunks
\ No newline at end of file
@@ -1,9 +1,8 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from ingestion import extract_sections_from_pdf
+from ingestion import extract_sections_from_pdf, file_hash
 from rag_engine import ResearchAssistant
-import os
 
 # Page Config
 st.set_page_config(page_title="ScholarAI: Research Intelligence", layout="wide")
@@ -15,6 +14,8 @@ if "chat_history" not in st.session_state:
     st.session_state.chat_history = []
 if "papers_loaded" not in st.session_state:
     st.session_state.papers_loaded = False
+if "paper_hashes" not in st.session_state:
+    st.session_state.paper_hashes = set()
 
 # --- Sidebar: Ingestion ---
 st.sidebar.title("📚 Library Management")
@@ -23,22 +24,38 @@ uploaded_files = st.sidebar.file_uploader("Upload Research Papers (PDF)", accept
 if uploaded_files and st.sidebar.button("Process Papers"):
     with st.spinner("Parsing and Indexing Papers..."):
         papers = []
-        # Save temp files for processing
-        os.makedirs("temp", exist_ok=True)
+        new_hashes = set()
+        failed = []
+        # Parse uploads straight from memory; skip files whose bytes were already ingested
         for uploaded_file in uploaded_files:
-            path = os.path.join("temp", uploaded_file.name)
-            with open(path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
+            with uploaded_file.getbuffer() as buffer:
+                digest = file_hash(buffer)
+            if digest in st.session_state.paper_hashes or digest in new_hashes:
+                continue
+
             # Ingest
-            paper = extract_sections_from_pdf(path)
+            uploaded_file.seek(0)
+            try:
+                paper = extract_sections_from_pdf(uploaded_file, filename=uploaded_file.name)
+            except Exception as e:
+                print(f"Failed to parse {uploaded_file.name}: {e}")
+                failed.append(uploaded_file.name)
+                continue
             papers.append(paper)
+            new_hashes.add(digest)
         
         # Index
-        success = st.session_state.assistant.ingest_papers(papers)
-        if success:
-            st.session_state.papers_loaded = True
-            st.sidebar.success(f"Successfully indexed {len(papers)} papers!")
+        if papers:
+            success = st.session_state.assistant.ingest_papers(papers)
+            if success:
+                # Only remember papers once they are actually in the vector store
+                st.session_state.paper_hashes.update(new_hashes)
+                st.session_state.papers_loaded = True
+                st.sidebar.success(f"Successfully indexed {len(papers)} papers!")
+        elif not failed:
+            st.sidebar.info("These papers are already indexed.")
+        if failed:
+            st.sidebar.warning(f"Could not parse {len(failed)} paper(s): {', '.join(failed)}")
 
 # --- Main Interface ---
 st.title("🧠 ScholarAI: Research Assistant")
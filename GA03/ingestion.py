@@ -1,5 +1,6 @@
 import os
-from typing import List, Optional
+import hashlib
+from typing import BinaryIO, List, Optional, Union
 from pydantic import BaseModel, Field
 from pypdf import PdfReader
 import re
@@ -22,8 +23,13 @@ class ResearchPaper(BaseModel):
     full_text: str = ""
 
 # --- 2. PDF Parsing Logic ---
-def extract_sections_from_pdf(pdf_path: str) -> ResearchPaper:
-    reader = PdfReader(pdf_path)
+def file_hash(data) -> str:
+    """SHA-256 of the raw upload bytes, used to skip papers already ingested under any name."""
+    return hashlib.sha256(data).hexdigest()
+
+def extract_sections_from_pdf(pdf: Union[str, BinaryIO], filename: Optional[str] = None) -> ResearchPaper:
+    # pypdf reads file paths and in-memory streams alike, so uploads never need a temp file
+    reader = PdfReader(pdf)
     full_text = ""
     sections = []
     
@@ -66,7 +72,8 @@ def extract_sections_from_pdf(pdf_path: str) -> ResearchPaper:
 
     # Basic metadata extraction (simulated)
     # In production, use an LLM or regex to extract authors/year from the first page text
-    filename = os.path.basename(pdf_path)
+    if filename is None:
+        filename = os.path.basename(pdf) if isinstance(pdf, str) else getattr(pdf, "name", "Untitled")
     
     return ResearchPaper(
         paper_id=filename,
@@ -45,7 +45,11 @@ class ResearchAssistant:
                 documents.extend(chunks)
         
         if documents:
-            self.vector_store = FAISS.from_documents(documents, embeddings)
+            # Add to the existing index so previously ingested papers remain searchable
+            if self.vector_store:
+                self.vector_store.add_documents(documents)
+            else:
+                self.vector_store = FAISS.from_documents(documents, embeddings)
             return True
         return False
 